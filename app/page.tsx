@@ -1,13 +1,15 @@
 'use client';
 
 import { useMeetings } from '@/hooks/useMeetings';
-import { useFilters } from '@/hooks/useFilters';
+import { useFilters, useFilteredMeetings } from '@/hooks/useFilters';
 import { Filters } from '@/components/Filters';
 import MeetingsTable from '@/components/MeetingsTable';
 
 export default function HomePage() {
-  const { meetings, loading, error } = useMeetings();
-  const { filters, filteredMeetings, updateFilter } = useFilters(meetings);
+  // Filters drive which feed shards are fetched, so they come first.
+  const { filters, updateFilter } = useFilters();
+  const { meetings, loading, error } = useMeetings(filters);
+  const filteredMeetings = useFilteredMeetings(meetings, filters);
 
   if (loading) {
     return (
@@ -1,10 +1,9 @@
 'use client';
 
 import * as React from 'react';
+import type { FilterState } from '@/hooks/useFilters';
 
-export type FilterState = {
-  chamber: 'all' | 'house' | 'senate';
-};
+export type { FilterState };
 
 type Props = {
   filters: FilterState;
@@ -27,7 +26,16 @@ export function Filters({ filters, updateFilter, totalCount, filteredCount }: Pr
           <option value="all">All</option>
           <option value="house">House</option>
           <option value="senate">Senate</option>
+          <option value="joint">Joint</option>
         </select>
+        <label htmlFor="since" style={label}>From</label>
+        <input
+          id="since"
+          type="month"
+          value={filters.since}
+          onChange={(e) => updateFilter('since', e.target.value)}
+          style={select}
+        />
       </div>
 
       <div style={{ fontSize: 13, color: '#4a5568' }}>
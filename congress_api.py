@@ -7,17 +7,36 @@ from typing import Dict, Generator, Iterable, Optional
 
 import requests
 from requests import Response, Session
-from tenacity import retry, retry_if_exception_type, stop_after_attempt, wait_exponential_jitter
+from tenacity import RetryCallState, retry, stop_after_attempt, wait_exponential_jitter
 
-from rate_limit import Throttler
+from rate_limit import CircuitBreaker, RetryBudget, Throttler
 
 LOGGER = logging.getLogger(__name__)
 
+MAX_ATTEMPTS = 5
+
 
 class CongressAPIError(RuntimeError):
     """Raised when the Congress.gov API returns an unexpected response."""
 
 
+def _should_retry(retry_state: RetryCallState) -> bool:
+    """Retry transient failures while the shared retry budget lasts."""
+
+    outcome = retry_state.outcome
+    if outcome is None or not outcome.failed:
+        return False
+    if not isinstance(outcome.exception(), (requests.RequestException, CongressAPIError)):
+        return False
+    if retry_state.attempt_number >= MAX_ATTEMPTS:
+        return False
+    budget = retry_state.args[0].retry_budget
+    if budget is not None and not budget.consume():
+        LOGGER.debug("Retry budget exhausted; not retrying %s", retry_state.args[1:])
+        return False
+    return True
+
+
 class CongressAPI:
     """Lightweight helper around the Congress.gov v3 API."""
 
@@ -28,11 +47,15 @@ class CongressAPI:
         base_url: str = "https://api.congress.gov/v3",
         session: Optional[Session] = None,
         throttler: Optional[Throttler] = None,
+        retry_budget: Optional[RetryBudget] = None,
+        circuit_breaker: Optional[CircuitBreaker] = None,
     ) -> None:
         self.api_key = api_key
         self.base_url = base_url.rstrip("/")
         self.session = session or requests.Session()
         self.throttler = throttler or Throttler(1.0)
+        self.retry_budget = retry_budget
+        self.circuit_breaker = circuit_breaker
 
     def iter_committees(
         self,
@@ -115,19 +138,28 @@ class CongressAPI:
             offset += limit
 
     @retry(
-        retry=retry_if_exception_type((requests.RequestException, CongressAPIError)),
+        retry=_should_retry,
         wait=wait_exponential_jitter(initial=1, max=30),
-        stop=stop_after_attempt(5),
+        stop=stop_after_attempt(MAX_ATTEMPTS),
         reraise=True,
     )
     def _get(self, path: str, params: Optional[Dict] = None) -> Dict:
         query = dict(params or {})
         query.update({"api_key": self.api_key, "format": "json"})
         url = f"{self.base_url}/{path}"
+        if self.circuit_breaker:
+            self.circuit_breaker.before_request()
         self.throttler.wait()
         LOGGER.debug("GET %s params=%s", url, query)
-        response = self.session.get(url, params=query, timeout=30)
-        self._check_response(response)
+        try:
+            response = self.session.get(url, params=query, timeout=30)
+            self._check_response(response)
+        except requests.RequestException as exc:
+            if self.circuit_breaker and _is_outage_error(exc):
+                self.circuit_breaker.record_failure()
+            raise
+        if self.circuit_breaker:
+            self.circuit_breaker.record_success()
         return response.json()
 
     @staticmethod
@@ -137,5 +169,14 @@ class CongressAPI:
             response.raise_for_status()
 
 
+def _is_outage_error(exc: requests.RequestException) -> bool:
+    """Whether ``exc`` signals an API-side problem rather than a bad request."""
+
+    response = getattr(exc, "response", None)
+    if response is None:
+        return True
+    return response.status_code == 429 or response.status_code >= 500
+
+
 __all__ = ["CongressAPI", "CongressAPIError"]
 
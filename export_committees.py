@@ -3,9 +3,14 @@
 from __future__ import annotations
 
 import argparse
+import hashlib
+import json
 import os
+import re
 from datetime import datetime
-from typing import Dict, Iterable, List, Mapping, Optional
+from pathlib import Path
+from time import monotonic, sleep
+from typing import Dict, Iterable, List, Mapping, Optional, Sequence, Tuple
 from uuid import uuid4
 
 try:
@@ -14,23 +19,135 @@ except ImportError:  # pragma: no cover - optional dependency
     load_dotenv = None
 
 from congress_api import CongressAPI
-from matching import build_hearings_index, match_printed_hearing
+from feed import write_feed
+from matching import HearingsIndex, build_hearings_index, match_printed_hearing
 from normalizers import CSV_COLUMNS, normalize_meeting_detail
-from rate_limit import Throttler
-from utils import setup_logger, write_csv
+from rate_limit import CircuitBreaker, RetryBudget, Throttler
+from utils import read_csv, setup_logger, write_csv, write_json
 
 
 CHAMBER_CHOICES = ["house", "senate", "joint", "all"]
 MEETING_TYPE_CHOICES = ["hearing", "markup", "business", "all"]
+OUTPUT_PATH = os.path.join("exports", "committee_meetings_119.csv")
+DEAD_LETTER_PATH = os.path.join("exports", "dead_letter_119.json")
+# Dead-lettered keys the listing no longer returns are dropped after this many failed runs.
+MAX_DEAD_LETTER_ATTEMPTS = 3
+# Retries available to the final pass over failed keys, independent of --retry-budget.
+FINAL_PASS_RETRIES = 25
+
+MeetingKey = Tuple[str, str]
+
+SHARD_SUFFIX = re.compile(r"\.shard-(\d+)-of-(\d+)\.[^.]+$")
+
+
+def parse_shard(value: str) -> Tuple[int, int]:
+    """Parse an ``i/N`` shard spec (0-based index) for argparse."""
+
+    try:
+        index_str, count_str = value.split("/", 1)
+        index, count = int(index_str), int(count_str)
+    except ValueError:
+        raise argparse.ArgumentTypeError(f"Invalid shard {value!r}; expected i/N, e.g. 0/4") from None
+    if count < 1 or not 0 <= index < count:
+        raise argparse.ArgumentTypeError(f"Invalid shard {value!r}; need 0 <= i < N")
+    return index, count
+
+
+def positive_float(value: str) -> float:
+    """Parse a strictly positive number of seconds for argparse."""
+
+    try:
+        number = float(value)
+    except ValueError:
+        raise argparse.ArgumentTypeError(f"Invalid number {value!r}") from None
+    if not number > 0:
+        raise argparse.ArgumentTypeError(f"Expected a positive number of seconds, got {value!r}")
+    return number
 
 
 def parse_args() -> argparse.Namespace:
     parser = argparse.ArgumentParser(description="Export committee meetings for the 119th Congress")
+    subparsers = parser.add_subparsers(dest="command")
+    merge_parser = subparsers.add_parser("merge", help="Combine --shard outputs into a single export")
+    merge_parser.add_argument("inputs", nargs="+", help="Shard CSV files written by --shard runs")
+    merge_parser.add_argument("--output", default=OUTPUT_PATH, help="Merged CSV path")
+    # Distinct dests: subparser defaults would otherwise overwrite the
+    # top-level --feed-dir/--fetch-run-id values.
+    merge_parser.add_argument(
+        "--fetch-run-id", dest="merge_fetch_run_id", default=None, help="Run id stamped on every row"
+    )
+    merge_parser.add_argument(
+        "--feed-dir", dest="merge_feed_dir", default=None, help="Also write the frontend JSON feed"
+    )
+    merge_parser.add_argument(
+        "--allow-partial",
+        dest="allow_partial",
+        action="store_true",
+        help="Merge even if shards are missing, come from different shard counts or disagree on run id",
+    )
+
     parser.add_argument("--chamber", choices=CHAMBER_CHOICES, default="all")
     parser.add_argument("--committee-code", dest="committee_code", help="Filter by committee system code", default=None)
     parser.add_argument("--meeting-type", choices=MEETING_TYPE_CHOICES, default="all")
     parser.add_argument("--since", help="Lower bound meeting date (YYYY-MM-DD)", default=None)
-    return parser.parse_args()
+    parser.add_argument(
+        "--feed-dir",
+        dest="feed_dir",
+        help="Also write the sharded frontend JSON feed to this directory (e.g. public/feed)",
+        default=None,
+    )
+    parser.add_argument(
+        "--retry-budget",
+        dest="retry_budget",
+        type=int,
+        default=500,
+        help="Maximum number of API retries for the whole run",
+    )
+    parser.add_argument(
+        "--breaker-cooldown",
+        dest="breaker_cooldown",
+        type=float,
+        default=60.0,
+        help="Seconds to pause all requests when the API error rate spikes",
+    )
+    parser.add_argument(
+        "--shard",
+        type=parse_shard,
+        default=None,
+        help="Hydrate only shard i of N (0-based, e.g. 0/4); combine outputs with the merge subcommand",
+    )
+    parser.add_argument(
+        "--fetch-run-id",
+        dest="fetch_run_id",
+        default=None,
+        help="Run id stamped on every row; pass the same value to every shard",
+    )
+    parser.add_argument(
+        "--watch",
+        type=positive_float,
+        default=None,
+        metavar="SECONDS",
+        help="Keep running, polling the meeting list every SECONDS and refreshing the export on change",
+    )
+    parser.add_argument(
+        "--hearings-refresh",
+        dest="hearings_refresh",
+        type=positive_float,
+        default=6 * 3600,
+        metavar="SECONDS",
+        help="In --watch mode, how often to rebuild the committee lookup and printed hearings index",
+    )
+    args = parser.parse_args()
+    if args.command == "merge":
+        defaults = vars(parser.parse_args([]))
+        for dest, default in defaults.items():
+            if dest in ("command", "feed_dir", "fetch_run_id"):
+                continue
+            if getattr(args, dest) != default:
+                parser.error(f"--{dest.replace('_', '-')} does not apply to merge")
+        args.feed_dir = args.merge_feed_dir or args.feed_dir
+        args.fetch_run_id = args.merge_fetch_run_id or args.fetch_run_id
+    return args
 
 
 def resolve_chambers(chamber: str) -> List[str]:
@@ -65,24 +182,193 @@ def committee_code_in_row(row: Mapping[str, str], committee_code: Optional[str])
     return committee_code.upper() in {code.upper() for code in codes if code}
 
 
-def main() -> None:
-    if load_dotenv:
-        load_dotenv()
+def shard_of(key: MeetingKey, count: int) -> int:
+    """Map a (chamber, eventId) key to a shard using a hash stable across hosts."""
 
-    args = parse_args()
-    logger = setup_logger()
+    digest = hashlib.sha1(f"{key[0]}/{key[1]}".encode("utf-8")).digest()
+    return int.from_bytes(digest[:8], "big") % count
 
-    api_key = os.environ.get("CONGRESS_API_KEY")
-    if not api_key:
-        raise SystemExit("CONGRESS_API_KEY not set. Create a .env file or export it in the environment.")
 
-    throttler = Throttler(1.0)
-    api = CongressAPI(api_key, throttler=throttler)
+def shard_path(path: str, shard: Optional[Tuple[int, int]]) -> str:
+    if not shard:
+        return path
+    stem, ext = os.path.splitext(path)
+    return f"{stem}.shard-{shard[0]}-of-{shard[1]}{ext}"
 
-    chambers = resolve_chambers(args.chamber)
-    since_date = parse_date(args.since) if args.since else None
 
-    logger.info("Building committee lookup…")
+def merge_key(row: Mapping[str, object]) -> Tuple[str, str, int, str]:
+    """Deterministic sort order for merged exports."""
+
+    event_id = str(row.get("eventId") or "")
+    return (
+        str(row.get("chamber") or "").lower(),
+        str(row.get("meetingDateTime") or ""),
+        int(event_id) if event_id.isdigit() else 0,
+        event_id,
+    )
+
+
+def check_shard_inputs(inputs: Sequence[os.PathLike[str] | str]) -> List[str]:
+    """Return problems that make ``inputs`` an incomplete set of ``i-of-N`` shards."""
+
+    problems: List[str] = []
+    counts = set()
+    indexes: Dict[int, List[str]] = {}
+    for path in inputs:
+        match = SHARD_SUFFIX.search(os.path.basename(os.fspath(path)))
+        if not match:
+            problems.append(f"{os.fspath(path)} is not named like a shard export (.shard-<i>-of-<N>)")
+            continue
+        index, count = int(match.group(1)), int(match.group(2))
+        counts.add(count)
+        indexes.setdefault(index, []).append(os.fspath(path))
+    if len(counts) > 1:
+        problems.append(f"inputs come from different shard counts: {sorted(counts)}")
+    elif counts:
+        count = counts.pop()
+        missing = [index for index in range(count) if index not in indexes]
+        if missing:
+            problems.append(f"missing shard(s) {missing} of {count}")
+    for index, paths in sorted(indexes.items()):
+        if len(paths) > 1:
+            problems.append(f"shard {index} given more than once: {paths}")
+    return problems
+
+
+def merge_shards(
+    inputs: Sequence[os.PathLike[str] | str],
+    *,
+    fetch_run_id: Optional[str] = None,
+    allow_partial: bool = False,
+) -> Tuple[List[Dict[str, str]], str, List[str]]:
+    """Combine shard exports into deterministically ordered rows.
+
+    Returns the rows, the run id they were stamped with and the problems
+    found with the inputs. Raises :class:`ValueError` when the inputs are
+    not a complete, consistent shard set or the shards disagree on
+    ``fetch_run_id``, unless ``allow_partial`` is set. Duplicate (chamber, eventId) rows
+    keep the most recently updated copy. Every row is stamped with
+    ``fetch_run_id``; when omitted the shards' common run id is reused.
+    Shards with differing run ids need an explicit ``fetch_run_id``.
+    """
+
+    problems = check_shard_inputs(inputs)
+
+    merged: Dict[Tuple[str, str], Dict[str, str]] = {}
+    run_ids = set()
+    for path in inputs:
+        for row in read_csv(path):
+            run_ids.add(row.get("fetch_run_id", ""))
+            key = (row.get("chamber", "").lower(), row.get("eventId", ""))
+            existing = merged.get(key)
+            if existing is None or row.get("updateDate", "") > existing.get("updateDate", ""):
+                merged[key] = row
+
+    run_ids.discard("")
+    if len(run_ids) > 1:
+        problems.append(f"shards disagree on fetch_run_id: {sorted(run_ids)}")
+    if problems and not allow_partial:
+        raise ValueError("; ".join(problems) + " (pass --allow-partial to merge anyway)")
+
+    if not fetch_run_id:
+        if len(run_ids) > 1:
+            raise ValueError("shards disagree on fetch_run_id; pass --fetch-run-id to choose one")
+        fetch_run_id = run_ids.pop() if run_ids else str(uuid4())
+    rows = sorted(merged.values(), key=merge_key)
+    for row in rows:
+        row["fetch_run_id"] = fetch_run_id
+    return rows, fetch_run_id, problems
+
+
+def run_merge(args: argparse.Namespace, logger) -> None:
+    logger.info("Merging %d shard exports…", len(args.inputs))
+    try:
+        rows, fetch_run_id, problems = merge_shards(
+            args.inputs, fetch_run_id=args.fetch_run_id, allow_partial=args.allow_partial
+        )
+    except ValueError as exc:
+        raise SystemExit(f"Refusing to merge: {exc}") from None
+    for problem in problems:
+        logger.warning("Merging anyway: %s", problem)
+    logger.info("Writing CSV to %s", args.output)
+    write_csv(rows, args.output, CSV_COLUMNS)
+    if args.feed_dir:
+        logger.info("Writing frontend feed to %s", args.feed_dir)
+        manifest = write_feed(rows, args.feed_dir, fetch_run_id=fetch_run_id)
+        logger.info("Wrote %d feed shards", len(manifest["shards"]))
+    logger.info("Done. Merged %d rows (fetch_run_id %s)", len(rows), fetch_run_id)
+
+
+def meeting_type_in_row(row: Mapping[str, object], meeting_type: str) -> bool:
+    """Mirror the listing's ``meetingType`` filter for requeued dead-letter keys."""
+
+    if not meeting_type or meeting_type == "all":
+        return True
+    return meeting_type.lower() in str(row.get("meetingType") or "").lower()
+
+
+def load_dead_letters(path: os.PathLike[str] | str, logger) -> Dict[MeetingKey, int]:
+    """Return the (chamber, eventId) keys left over by previous runs and their failed attempts.
+
+    An unreadable or malformed file is logged and treated as empty, so a
+    bad dead-letter file never blocks an export.
+    """
+
+    path_obj = Path(path)
+    if not path_obj.exists():
+        return {}
+    try:
+        data = json.loads(path_obj.read_text(encoding="utf-8"))
+    except (OSError, ValueError) as exc:
+        logger.warning("Ignoring unreadable dead-letter file %s: %s", path_obj, exc)
+        return {}
+    entries = data.get("keys") if isinstance(data, dict) else None
+    if not isinstance(entries, list):
+        logger.warning("Ignoring malformed dead-letter file %s", path_obj)
+        return {}
+    dead_letters: Dict[MeetingKey, int] = {}
+    skipped = 0
+    for entry in entries:
+        if not isinstance(entry, list) or len(entry) not in (2, 3):
+            skipped += 1
+            continue
+        chamber, event_id, *rest = entry
+        attempts = rest[0] if rest else 1
+        if not isinstance(attempts, int):
+            skipped += 1
+            continue
+        dead_letters[(str(chamber), str(event_id))] = attempts
+    if skipped:
+        logger.warning("Skipped %d malformed entries in dead-letter file %s", skipped, path_obj)
+    return dead_letters
+
+
+def save_dead_letters(
+    dead_letters: Mapping[MeetingKey, int], path: os.PathLike[str] | str, *, fetch_run_id: str
+) -> None:
+    keys = [[chamber, event_id, attempts] for (chamber, event_id), attempts in dead_letters.items()]
+    write_json({"fetch_run_id": fetch_run_id, "keys": keys}, path)
+
+
+def fetch_details(
+    api: CongressAPI, keys: Iterable[MeetingKey], logger
+) -> Tuple[List[Tuple[MeetingKey, Mapping]], List[MeetingKey]]:
+    """Fetch meeting details, returning hydrated details and failed keys."""
+
+    details: List[Tuple[MeetingKey, Mapping]] = []
+    failed: List[MeetingKey] = []
+    for chamber, event_id in keys:
+        try:
+            detail = api.get_committee_meeting_detail(congress=119, chamber=chamber, event_id=event_id)
+        except Exception as exc:  # pragma: no cover - logged and dead-lettered
+            logger.warning("Failed to fetch meeting %s/%s: %s", chamber, event_id, exc)
+            failed.append((chamber, event_id))
+            continue
+        details.append(((chamber, event_id), detail))
+    return details, failed
+
+
+def build_committee_lookup(api: CongressAPI, chambers: Iterable[str]) -> Dict[str, Dict[str, str]]:
     committees_lookup: Dict[str, Dict[str, str]] = {}
     for chamber in chambers:
         for committee in api.iter_committees(congress=119, chamber=chamber):
@@ -92,57 +378,273 @@ def main() -> None:
                     "name": committee.get("name", ""),
                     "chamber": chamber,
                 }
+    return committees_lookup
 
-    logger.info("Enumerating committee meetings…")
-    meeting_keys: List[tuple[str, str]] = []
+
+def enumerate_meetings(api: CongressAPI, chambers: Iterable[str], meeting_type: str) -> Dict[MeetingKey, str]:
+    """Return meeting keys in listing order mapped to their stub ``updateDate``."""
+
+    stubs: Dict[MeetingKey, str] = {}
     for chamber in chambers:
-        for item in api.iter_committee_meetings(congress=119, chamber=chamber, meeting_type=args.meeting_type):
+        for item in api.iter_committee_meetings(congress=119, chamber=chamber, meeting_type=meeting_type):
             event_id = str(item.get("eventId") or item.get("eventID"))
             if not event_id:
                 continue
-            meeting_keys.append((chamber, event_id))
+            stubs[(chamber, event_id)] = str(item.get("updateDate") or "")
+    return stubs
 
-    logger.info("Found %d meeting stubs", len(meeting_keys))
 
-    logger.info("Fetching printed hearings…")
+def load_hearings_index(api: CongressAPI, chambers: Iterable[str]) -> HearingsIndex:
     hearings: List[Mapping] = []
     for chamber in chambers:
         hearings.extend(list(api.iter_hearings(congress=119, chamber=chamber)))
-    hearings_index = build_hearings_index(hearings)
+    return build_hearings_index(hearings)
+
+
+def build_row(
+    detail: Mapping,
+    committees_lookup: Mapping[str, Mapping[str, str]],
+    args: argparse.Namespace,
+    since_date: Optional[datetime],
+) -> Optional[Dict[str, object]]:
+    """Normalize ``detail``, returning ``None`` when the CLI filters exclude it."""
+
+    row = normalize_meeting_detail(detail, committees_lookup)
+    if not filter_since(row.get("meetingDateTime", ""), since_date):
+        return None
+    if not committee_code_in_row(row, args.committee_code):
+        return None
+    return row
+
+
+def apply_match(row: Dict[str, object], hearings_index: HearingsIndex) -> None:
+    pdf_url, method, confidence = match_printed_hearing(row, hearings_index)
+    row["printed_hearing_pdf_url"] = pdf_url
+    row["printed_hearing_match_method"] = method
+    row["printed_hearing_match_confidence"] = confidence
+
+
+def write_outputs(rows: List[Dict[str, object]], args: argparse.Namespace, fetch_run_id: str, logger) -> None:
+    output_path = shard_path(OUTPUT_PATH, args.shard)
+    logger.info("Writing CSV to %s", output_path)
+    write_csv(rows, output_path, CSV_COLUMNS)
+    if args.feed_dir and args.shard:
+        logger.warning("Ignoring --feed-dir for a shard run; pass it to the merge subcommand instead")
+    elif args.feed_dir:
+        logger.info("Writing frontend feed to %s", args.feed_dir)
+        manifest = write_feed(rows, args.feed_dir, fetch_run_id=fetch_run_id)
+        logger.info("Wrote %d feed shards", len(manifest["shards"]))
+
+
+def make_scope(chambers: Sequence[str], shard: Optional[Tuple[int, int]]):
+    def in_scope(key: MeetingKey) -> bool:
+        return key[0] in chambers and (not shard or shard_of(key, shard[1]) == shard[0])
+
+    return in_scope
+
+
+def run_export(api: CongressAPI, args: argparse.Namespace, logger) -> None:
+    chambers = resolve_chambers(args.chamber)
+    since_date = parse_date(args.since) if args.since else None
+    in_scope = make_scope(chambers, args.shard)
+
+    logger.info("Building committee lookup…")
+    committees_lookup = build_committee_lookup(api, chambers)
+
+    logger.info("Enumerating committee meetings…")
+    meeting_keys: List[MeetingKey] = list(enumerate_meetings(api, chambers, args.meeting_type))
+
+    logger.info("Found %d meeting stubs", len(meeting_keys))
+
+    if args.shard:
+        meeting_keys = [key for key in meeting_keys if in_scope(key)]
+        logger.info("Shard %d/%d: hydrating %d meetings", args.shard[0], args.shard[1], len(meeting_keys))
+
+    dead_letter_path = shard_path(DEAD_LETTER_PATH, args.shard)
+    listed_keys = set(meeting_keys)
+    dead_letters = load_dead_letters(dead_letter_path, logger)
+    carried_over = [key for key in dead_letters if in_scope(key) and key not in listed_keys]
+    # Keys outside this run's chambers or shard stay queued for a later one.
+    requeue = {key: attempts for key, attempts in dead_letters.items() if not in_scope(key)}
+    if carried_over:
+        logger.info("Re-queueing %d dead-lettered meetings from a previous run", len(carried_over))
+        meeting_keys.extend(carried_over)
+
+    logger.info("Fetching printed hearings…")
+    hearings_index = load_hearings_index(api, chambers)
 
     logger.info("Hydrating meeting details…")
-    rows = []
-    skipped = 0
-    fetch_run_id = str(uuid4())
-    for chamber, event_id in meeting_keys:
-        try:
-            detail = api.get_committee_meeting_detail(congress=119, chamber=chamber, event_id=event_id)
-        except Exception as exc:  # pragma: no cover - logged and skipped
-            logger.warning("Failed to fetch meeting %s/%s: %s", chamber, event_id, exc)
-            skipped += 1
+    fetch_run_id = args.fetch_run_id or str(uuid4())
+    details, failed = fetch_details(api, meeting_keys, logger)
+    if failed:
+        logger.info("Retrying %d failed meetings in a final pass…", len(failed))
+        # Give the final pass a closed circuit and its own retries; the
+        # main pass may have tripped the breaker and spent the budget.
+        if api.circuit_breaker:
+            api.circuit_breaker.reset()
+        api.retry_budget = RetryBudget(FINAL_PASS_RETRIES)
+        retried, failed = fetch_details(api, failed, logger)
+        details.extend(retried)
+    skipped = len(failed)
+
+    expired = 0
+    for key in failed:
+        attempts = dead_letters.get(key, 0) + 1
+        if key not in listed_keys and attempts >= MAX_DEAD_LETTER_ATTEMPTS:
+            expired += 1
             continue
+        requeue[key] = attempts
 
-        row = normalize_meeting_detail(detail, committees_lookup)
-        if not filter_since(row.get("meetingDateTime", ""), since_date):
+    rows = []
+    requeued_keys = set(carried_over)
+    for key, detail in details:
+        row = build_row(detail, committees_lookup, args, since_date)
+        if row is None:
             continue
-        if not committee_code_in_row(row, args.committee_code):
+        # Requeued keys bypassed the listing's meetingType filter.
+        if key in requeued_keys and not meeting_type_in_row(row, args.meeting_type):
             continue
-
-        pdf_url, method, confidence = match_printed_hearing(row, hearings_index)
-        row["printed_hearing_pdf_url"] = pdf_url
-        row["printed_hearing_match_method"] = method
-        row["printed_hearing_match_confidence"] = confidence
+        apply_match(row, hearings_index)
         row["fetch_run_id"] = fetch_run_id
         rows.append(row)
 
     logger.info("Hydrated %d meetings, skipped %d", len(rows), skipped)
+    save_dead_letters(requeue, dead_letter_path, fetch_run_id=fetch_run_id)
+    if failed:
+        logger.info("Saved %d dead-lettered meetings to %s for the next run", len(failed) - expired, dead_letter_path)
+    if expired:
+        logger.warning("Dropped %d unlisted meetings after %d failed runs", expired, MAX_DEAD_LETTER_ATTEMPTS)
 
-    output_path = os.path.join("exports", "committee_meetings_119.csv")
-    logger.info("Writing CSV to %s", output_path)
-    write_csv(rows, output_path, CSV_COLUMNS)
+    write_outputs(rows, args, fetch_run_id, logger)
     logger.info("Done. Exported %d rows", len(rows))
 
 
+def run_watch(api: CongressAPI, args: argparse.Namespace, logger) -> None:
+    """Poll the meeting list and refresh the export as meetings change.
+
+    The API session, committee lookup and hearings index stay in memory
+    between polls; the lookup and index are rebuilt every
+    ``--hearings-refresh`` seconds, at which point every row is rebuilt
+    from its cached detail so committee names and matches pick up the
+    refreshed data. Each poll enumerates the meeting list, hydrates only
+    meetings whose stub ``updateDate`` changed (or which failed last
+    time), drops meetings no longer listed, and rewrites the export
+    atomically when anything changed. Changes and refreshes stay pending
+    until a write succeeds, so a failed poll or write is picked up by the
+    next poll.
+    """
+
+    chambers = resolve_chambers(args.chamber)
+    since_date = parse_date(args.since) if args.since else None
+    in_scope = make_scope(chambers, args.shard)
+    fetch_run_id = args.fetch_run_id or str(uuid4())
+
+    versions: Dict[MeetingKey, str] = {}
+    cached_details: Dict[MeetingKey, Mapping] = {}
+    rows: Dict[MeetingKey, Dict[str, object]] = {}
+    committees_lookup: Dict[str, Dict[str, str]] = {}
+    hearings_index = HearingsIndex()
+    hearings_loaded_at: Optional[float] = None
+    # Pending work that survives a failed poll: rows changed but not yet
+    # written, and a lookup/index refresh not yet applied to every row.
+    dirty = False
+    needs_rebuild = False
+
+    logger.info("Watching committee meetings every %ss (fetch_run_id %s)", args.watch, fetch_run_id)
+    while True:
+        started = monotonic()
+        # Budgets are per poll so one bad poll cannot starve the next.
+        if api.retry_budget:
+            api.retry_budget.reset()
+        if api.circuit_breaker:
+            api.circuit_breaker.reset()
+        try:
+            if hearings_loaded_at is None or started - hearings_loaded_at >= args.hearings_refresh:
+                logger.info("Refreshing committee lookup and printed hearings…")
+                committees_lookup = build_committee_lookup(api, chambers)
+                hearings_index = load_hearings_index(api, chambers)
+                hearings_loaded_at = started
+                needs_rebuild = True
+
+            listed = enumerate_meetings(api, chambers, args.meeting_type)
+            stubs = {key: version for key, version in listed.items() if in_scope(key)}
+            changed = [key for key, version in stubs.items() if versions.get(key) != version]
+            removed = [key for key in versions if key not in stubs]
+            for key in removed:
+                versions.pop(key, None)
+                cached_details.pop(key, None)
+                rows.pop(key, None)
+                dirty = True
+
+            details, failed = fetch_details(api, changed, logger)
+            for key, detail in details:
+                versions[key] = stubs[key]
+                cached_details[key] = detail
+                dirty = True
+            # After a refresh every cached detail is re-normalized against
+            # the new committee lookup; otherwise only the fresh ones are.
+            rebuild = list(cached_details.items()) if needs_rebuild else details
+            for key, detail in rebuild:
+                row = build_row(detail, committees_lookup, args, since_date)
+                if row is None:
+                    rows.pop(key, None)
+                    continue
+                apply_match(row, hearings_index)
+                row["fetch_run_id"] = fetch_run_id
+                rows[key] = row
+
+            logger.info(
+                "Poll: %d listed, %d hydrated, %d removed, %d failed",
+                len(stubs),
+                len(details),
+                len(removed),
+                len(failed),
+            )
+            if dirty or needs_rebuild:
+                write_outputs(list(rows.values()), args, fetch_run_id, logger)
+                # Cleared only once the export reflects the new state, so a
+                # failed poll or write is retried on the next one.
+                dirty = False
+                needs_rebuild = False
+        except Exception as exc:  # pragma: no cover - logged, retried next poll
+            logger.warning("Watch poll failed: %s", exc)
+
+        sleep(max(0.0, args.watch - (monotonic() - started)))
+
+
+def main() -> None:
+    if load_dotenv:
+        load_dotenv()
+
+    args = parse_args()
+    logger = setup_logger()
+
+    if args.command == "merge":
+        run_merge(args, logger)
+        return
+
+    api_key = os.environ.get("CONGRESS_API_KEY")
+    if not api_key:
+        raise SystemExit("CONGRESS_API_KEY not set. Create a .env file or export it in the environment.")
+
+    throttler = Throttler(1.0)
+    api = CongressAPI(
+        api_key,
+        throttler=throttler,
+        retry_budget=RetryBudget(args.retry_budget),
+        circuit_breaker=CircuitBreaker(cooldown=args.breaker_cooldown),
+    )
+
+    if args.watch is not None:
+        try:
+            run_watch(api, args, logger)
+        except KeyboardInterrupt:  # pragma: no cover - interactive stop
+            logger.info("Stopped watching")
+        return
+
+    run_export(api, args, logger)
+
+
 if __name__ == "__main__":  # pragma: no cover
     main()
 
@@ -0,0 +1,205 @@
+"""Sharded static JSON feed generation for the web frontend."""
+
+from __future__ import annotations
+
+import hashlib
+import json
+import os
+from datetime import datetime, timezone
+from pathlib import Path
+from typing import Dict, Iterable, List, Mapping, Tuple
+from zoneinfo import ZoneInfo
+
+from normalizers import clean_text
+from utils import write_json
+
+
+MANIFEST_NAME = "manifest.json"
+SHARDS_DIRNAME = "shards"
+UNDATED_MONTH = "undated"
+HASH_LENGTH = 12
+# Meeting times are shown, and shards bucketed, in Capitol local time.
+LOCAL_TZ = ZoneInfo("America/New_York")
+EVENT_URL = "https://www.congress.gov/event/{congress}-congress/{chamber}-event/{event_id}"
+
+
+def _ordinal(number: int) -> str:
+    if 10 <= number % 100 <= 20:
+        suffix = "th"
+    else:
+        suffix = {1: "st", 2: "nd", 3: "rd"}.get(number % 10, "th")
+    return f"{number}{suffix}"
+
+
+def local_date_time(meeting_dt: str) -> Tuple[str, str]:
+    """Split a UTC ISO timestamp into local ``(YYYY-MM-DD, HH:MM)``."""
+
+    if not meeting_dt:
+        return "", ""
+    try:
+        parsed = datetime.fromisoformat(meeting_dt.replace("Z", "+00:00"))
+    except ValueError:
+        date, _, time = meeting_dt.partition("T")
+        return date, time[:5]
+    if parsed.tzinfo is None:
+        parsed = parsed.replace(tzinfo=timezone.utc)
+    local = parsed.astimezone(LOCAL_TZ)
+    return local.strftime("%Y-%m-%d"), local.strftime("%H:%M")
+
+
+def event_page_url(congress: int, chamber: str, event_id: str) -> str:
+    """Public congress.gov page for a House or Senate committee meeting."""
+
+    if chamber not in ("house", "senate") or not event_id:
+        return ""
+    return EVENT_URL.format(congress=_ordinal(congress), chamber=chamber, event_id=event_id)
+
+
+def feed_record(row: Mapping[str, object]) -> Dict[str, object]:
+    """Project a normalized export row onto the frontend ``Meeting`` shape."""
+
+    date, time = local_date_time(str(row.get("meetingDateTime") or ""))
+    title = clean_text(str(row.get("title") or ""))
+    committee_names = [name for name in str(row.get("committee_names") or "").split("|") if name]
+    building_room = " ".join(
+        part for part in (clean_text(str(row.get("location_building") or "")), clean_text(str(row.get("location_room") or ""))) if part
+    )
+    location = ", ".join(
+        part
+        for part in (building_room, clean_text(str(row.get("location_city") or "")), clean_text(str(row.get("location_state") or "")))
+        if part
+    )
+
+    # Rows read back from CSV (e.g. by ``merge``) carry strings; the
+    # frontend types ``congress`` as a number.
+    congress_value = str(row.get("congress") or "").strip()
+    congress = int(congress_value) if congress_value.isdigit() else 119
+    meeting_id = str(row.get("eventId") or "")
+    chamber = str(row.get("chamber") or "").lower()
+
+    record: Dict[str, object] = {
+        "meeting_id": meeting_id,
+        "congress": congress,
+        "chamber": chamber,
+        "meeting_type": row.get("meetingType") or "",
+        "committee_name": committee_names[0] if committee_names else "",
+        "subcommittee_name": row.get("subcommittee_name") or "",
+        "official_title": title,
+        "title_or_subject": title,
+        "date": date,
+        "start_time": time,
+        "location": location,
+        "status": row.get("status") or "",
+        # meeting_detail_url is the api.congress.gov record, which needs a key.
+        "detail_page_url": event_page_url(congress, chamber, meeting_id),
+        "witnesses": row.get("witnesses_list") or "",
+        "related_legislation": ", ".join(
+            bill for bill in str(row.get("related_bills_list") or "").split("|") if bill
+        ),
+        "printed_hearing_url": row.get("printed_hearing_pdf_url") or "",
+    }
+    # Drop empty optional fields to keep shards small.
+    return {key: value for key, value in record.items() if value not in ("", None)}
+
+
+def shard_key(record: Mapping[str, object]) -> Tuple[str, str]:
+    """Return the ``(chamber, month)`` shard a feed record belongs to.
+
+    ``date`` is already the local meeting date, so late-evening meetings on
+    the last day of a month stay in that month's shard.
+    """
+
+    chamber = str(record.get("chamber") or "") or "unknown"
+    date = str(record.get("date") or "")
+    month = date[:7] if len(date) >= 7 else UNDATED_MONTH
+    return chamber, month
+
+
+def _encode(data: object) -> bytes:
+    return json.dumps(data, ensure_ascii=False, separators=(",", ":"), sort_keys=True).encode("utf-8")
+
+
+def _sort_key(record: Mapping[str, object]) -> Tuple[str, str, str]:
+    return (str(record.get("date") or ""), str(record.get("start_time") or ""), str(record.get("meeting_id") or ""))
+
+
+def _manifest_shard_names(path: Path) -> set[str]:
+    """Return the shard file names referenced by the manifest at ``path``."""
+
+    try:
+        manifest = json.loads(path.read_text(encoding="utf-8"))
+    except (OSError, ValueError):
+        return set()
+    return {Path(str(entry.get("path", ""))).name for entry in manifest.get("shards", []) if isinstance(entry, Mapping)}
+
+
+def write_feed(
+    rows: Iterable[Mapping[str, object]],
+    out_dir: os.PathLike[str] | str,
+    *,
+    fetch_run_id: str = "",
+) -> Dict[str, object]:
+    """Write per-chamber/per-month shards plus a manifest.
+
+    Shard file names embed a content hash so they can be served with
+    long-lived cache headers; only ``manifest.json`` needs to be
+    revalidated. Shards are written before the manifest. Pruning keeps
+    the shards of both the new and the previous manifest, so a client
+    that fetched the previous manifest just before this write can still
+    load its shards; anything older is removed. Returns the manifest.
+    """
+
+    out_path = Path(out_dir)
+    shards_path = out_path / SHARDS_DIRNAME
+    shards_path.mkdir(parents=True, exist_ok=True)
+    manifest_path = out_path / MANIFEST_NAME
+    previous = _manifest_shard_names(manifest_path)
+
+    grouped: Dict[Tuple[str, str], List[Dict[str, object]]] = {}
+    for row in rows:
+        record = feed_record(row)
+        if not record.get("meeting_id"):
+            continue
+        grouped.setdefault(shard_key(record), []).append(record)
+
+    shard_entries: List[Dict[str, object]] = []
+    written = set()
+    for (chamber, month), records in sorted(grouped.items()):
+        records.sort(key=_sort_key)
+        payload = _encode(records)
+        digest = hashlib.sha256(payload).hexdigest()[:HASH_LENGTH]
+        filename = f"{chamber}-{month}.{digest}.json"
+        target = shards_path / filename
+        if not target.exists():
+            tmp_target = target.with_name(filename + ".tmp")
+            tmp_target.write_bytes(payload)
+            os.replace(tmp_target, target)
+        written.add(filename)
+        shard_entries.append(
+            {
+                "chamber": chamber,
+                "month": month,
+                "path": f"{SHARDS_DIRNAME}/{filename}",
+                "hash": digest,
+                "count": len(records),
+            }
+        )
+
+    manifest: Dict[str, object] = {
+        "version": 1,
+        "updated_at": datetime.now(timezone.utc).isoformat().replace("+00:00", "Z"),
+        "fetch_run_id": fetch_run_id,
+        "count": sum(int(entry["count"]) for entry in shard_entries),
+        "shards": shard_entries,
+    }
+    write_json(manifest, manifest_path)
+
+    keep = written | previous
+    for stale in shards_path.glob("*.json"):
+        if stale.name not in keep:
+            stale.unlink()
+
+    return manifest
+
+
+__all__ = ["feed_record", "shard_key", "write_feed"]
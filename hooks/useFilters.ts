@@ -3,26 +3,36 @@
 import { useMemo, useState } from "react";
 import type { Meeting } from "./useMeetings";
 
-type Filters = {
-  chamber: "all" | "house" | "senate";
+export type FilterState = {
+  chamber: "all" | "house" | "senate" | "joint";
+  // YYYY-MM; empty means no lower bound
+  since: string;
 };
 
-export function useFilters(meetings: Meeting[] | undefined | null) {
-  const [filters, setFilters] = useState<Filters>({ chamber: "all" });
+export function useFilters() {
+  const [filters, setFilters] = useState<FilterState>({ chamber: "all", since: "" });
 
+  function updateFilter<K extends keyof FilterState>(key: K, value: FilterState[K]) {
+    setFilters((prev) => ({ ...prev, [key]: value }));
+  }
+
+  return { filters, updateFilter };
+}
+
+// Client-side pass over whatever was loaded; the sharded feed already
+// narrows by chamber and month, the fallback sources do not.
+export function useFilteredMeetings(meetings: Meeting[] | undefined | null, filters: FilterState) {
   const list: Meeting[] = Array.isArray(meetings) ? meetings : [];
 
-  const filteredMeetings = useMemo(() => {
+  return useMemo(() => {
+    const sinceTs = filters.since ? Date.parse(`${filters.since}-01`) : 0;
     return list.filter((m) => {
       if (filters.chamber !== "all" && m.chamber !== filters.chamber) return false;
+      if (sinceTs) {
+        const t = Date.parse(m.date || "");
+        if (!t || t < sinceTs) return false;
+      }
       return true;
     });
   }, [list, filters]);
-
-  function updateFilter<K extends keyof Filters>(key: K, value: Filters[K]) {
-    setFilters((prev) => ({ ...prev, [key]: value }));
-  }
-
-  return { filters, updateFilter, filteredMeetings };
 }
-
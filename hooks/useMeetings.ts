@@ -1,13 +1,14 @@
 'use client';
 
 import { useEffect, useState } from "react";
+import type { FilterState } from "./useFilters";
 
 export type Meeting = {
   congress?: number;
   session?: string | number;
   meeting_id: string;
   meeting_type?: string;
-  chamber?: "house" | "senate";
+  chamber?: "house" | "senate" | "joint";
   committee_name?: string;
   // NEW:
   official_title?: string;
@@ -30,16 +31,55 @@ export type Meeting = {
 
 type FetchResponse = { updated_at?: string; count?: number; meetings?: Meeting[] } | Meeting[];
 
-export function useMeetings() {
+type FeedShard = { chamber: string; month: string; path: string; hash: string; count: number };
+type FeedManifest = { updated_at?: string; count?: number; shards: FeedShard[] };
+
+const FEED_BASE = '/feed';
+
+// Load only the shards matching the chamber and month filters. Shard paths
+// are content-hashed, so they can be cached; only the manifest is revalidated.
+async function loadFeed(filters: FilterState): Promise<{ meetings: Meeting[]; updated_at?: string; count?: number } | null> {
+  const res = await fetch(`${FEED_BASE}/manifest.json`, { cache: 'no-cache' });
+  if (!res.ok) return null;
+  const manifest: FeedManifest = await res.json();
+  const shards = manifest.shards.filter(
+    (s) =>
+      (filters.chamber === 'all' || s.chamber === filters.chamber) &&
+      (!filters.since || (s.month !== 'undated' && s.month >= filters.since))
+  );
+  const parts = await Promise.all(
+    shards.map(async (s) => {
+      const r = await fetch(`${FEED_BASE}/${s.path}`);
+      if (!r.ok) throw new Error(`Failed to load ${s.path}`);
+      return (await r.json()) as Meeting[];
+    })
+  );
+  const meetings = parts.flat();
+  return { meetings, updated_at: manifest.updated_at, count: meetings.length };
+}
+
+export function useMeetings(filters: FilterState) {
   const [meetings, setMeetings] = useState<Meeting[]>([]);
   const [meta, setMeta] = useState<{ updated_at?: string; count?: number }>({});
   const [loading, setLoading] = useState(true);
   const [error, setError] = useState<string | null>(null);
 
+  const { chamber, since } = filters;
+
   useEffect(() => {
+    let cancelled = false;
     (async () => {
       try {
-        // Try API route first
+        // Prefer the sharded feed written by export_committees.py --feed-dir
+        const feed = await loadFeed({ chamber, since }).catch(() => null);
+        if (cancelled) return;
+        if (feed) {
+          setMeetings(feed.meetings);
+          setMeta({ updated_at: feed.updated_at, count: feed.count });
+          return;
+        }
+
+        // Try API route next
         const res = await fetch('/api/meetings', { cache: 'no-store' });
         let data: FetchResponse;
         if (res.ok) {
@@ -50,17 +90,21 @@ export function useMeetings() {
           data = await res2.json();
         }
 
+        if (cancelled) return;
         const arr = Array.isArray(data) ? data : (data.meetings || []);
         const metaInfo = Array.isArray(data) ? {} : { updated_at: data.updated_at, count: data.count };
         setMeetings(arr);
         setMeta(metaInfo);
       } catch (e: any) {
-        setError(e?.message || 'Failed to load meetings');
+        if (!cancelled) setError(e?.message || 'Failed to load meetings');
       } finally {
-        setLoading(false);
+        if (!cancelled) setLoading(false);
       }
     })();
-  }, []);
+    return () => {
+      cancelled = true;
+    };
+  }, [chamber, since]);
 
   return { meetings, meta, loading, error };
 }
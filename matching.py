@@ -2,6 +2,8 @@
 
 from __future__ import annotations
 
+import re
+from collections import Counter
 from dataclasses import dataclass
 from datetime import datetime, timedelta
 from typing import Dict, Iterable, List, Mapping, Optional, Sequence, Tuple
@@ -74,8 +76,102 @@ class HearingRecord:
     witnesses: Sequence[str]
 
 
-def build_hearings_index(hearings: Iterable[Mapping]) -> Dict[str, List[HearingRecord]]:
-    index: Dict[str, List[HearingRecord]] = {}
+TOKEN_PATTERN = re.compile(r"[a-z0-9]+")
+TITLE_STOPWORDS = frozenset(
+    {
+        "about", "act", "against", "american", "americans", "before", "committee", "congress",
+        "examining", "from", "full", "hearing", "house", "into", "legislative", "meeting",
+        "oversight", "review", "senate", "states", "subcommittee", "their", "this", "united",
+        "with",
+    }
+)
+# Tokens posted to more hearings than this are too common to be distinctive.
+MAX_TOKEN_POSTINGS = 50
+MAX_FALLBACK_CANDIDATES = 25
+
+
+class HearingsIndex(dict[str, List[HearingRecord]]):
+    """Hearing records keyed by committee system code.
+
+    Alongside the per-committee mapping, the index keeps inverted
+    indexes from witness surnames and distinctive title tokens to
+    positions in :attr:`records`, so hearings filed under a different
+    committee can be found without scanning every record.
+    """
+
+    def __init__(self) -> None:
+        super().__init__()
+        self.records: List[HearingRecord] = []
+        self.by_witness: Dict[str, List[int]] = {}
+        self.by_title_token: Dict[str, List[int]] = {}
+
+    def add(self, record: HearingRecord) -> None:
+        position = len(self.records)
+        self.records.append(record)
+        self.setdefault(record.system_code, []).append(record)
+        for surname in {_surname(witness) for witness in record.witnesses} - {""}:
+            self.by_witness.setdefault(surname, []).append(position)
+        for token in _title_tokens(record.title):
+            self.by_title_token.setdefault(token, []).append(position)
+
+    def prune_common_tokens(self) -> None:
+        self.by_title_token = {
+            token: postings for token, postings in self.by_title_token.items() if len(postings) <= MAX_TOKEN_POSTINGS
+        }
+
+    def candidates(self, surnames: Iterable[str], tokens: Iterable[str]) -> List[HearingRecord]:
+        """Return records sharing a witness surname or title tokens, best first.
+
+        A shared surname counts as two hits, a shared title token as one;
+        records need at least two hits to be considered.
+        """
+
+        hits: Counter[int] = Counter()
+        for surname in set(surnames):
+            for position in self.by_witness.get(surname, ()):
+                hits[position] += 2
+        for token in set(tokens):
+            for position in self.by_title_token.get(token, ()):
+                hits[position] += 1
+        return [
+            self.records[position]
+            for position, count in hits.most_common(MAX_FALLBACK_CANDIDATES)
+            if count >= 2
+        ]
+
+
+def _surname(name: str) -> str:
+    """Extract a lower-cased surname from ``Last, First`` or ``First Last``."""
+
+    name = clean_text(name)
+    if "," in name:
+        name = name.split(",", 1)[0]
+    else:
+        parts = name.split()
+        name = parts[-1] if parts else ""
+    return "".join(TOKEN_PATTERN.findall(name.lower()))
+
+
+def _title_tokens(title: str) -> set[str]:
+    return {
+        token
+        for token in TOKEN_PATTERN.findall((title or "").lower())
+        if len(token) >= 4 and not token.isdigit() and token not in TITLE_STOPWORDS
+    }
+
+
+def _witness_name(item: object) -> str:
+    if isinstance(item, Mapping):
+        last = clean_text(item.get("lastName"))
+        first = clean_text(item.get("firstName"))
+        if last:
+            return ", ".join(part for part in (last, first) if part)
+        return clean_text(item.get("name"))
+    return clean_text(str(item))
+
+
+def build_hearings_index(hearings: Iterable[Mapping]) -> HearingsIndex:
+    index = HearingsIndex()
     for hearing in hearings:
         if not isinstance(hearing, Mapping):
             continue
@@ -96,13 +192,24 @@ def build_hearings_index(hearings: Iterable[Mapping]) -> Dict[str, List[HearingR
         if isinstance(witness_list, Mapping) and "item" in witness_list:
             witness_list = witness_list["item"]
         if isinstance(witness_list, list):
-            witnesses = [clean_text(str(item)) for item in witness_list]
+            witnesses = [_witness_name(item) for item in witness_list]
         record = HearingRecord(system_code=system_code, date=date, title=title, pdf_url=pdf_url, witnesses=witnesses)
-        index.setdefault(system_code, []).append(record)
+        index.add(record)
+    index.prune_common_tokens()
     return index
 
 
 def match_printed_hearing(row: Mapping[str, str], hearings_index: Mapping[str, List[HearingRecord]]):
+    """Link ``row`` to a printed hearing.
+
+    Explicit printed-hearing documents win outright. Otherwise hearings
+    filed under the meeting's own committees are fuzzy matched on title,
+    date and witnesses; if none qualifies and ``hearings_index`` is a
+    :class:`HearingsIndex`, candidates from other committees sharing a
+    witness surname or distinctive title tokens are tried next and tagged
+    ``cross_committee_index``.
+    """
+
     system_codes = (row.get("committee_codes") or "").split("|")
     meeting_date_str = row.get("meetingDateTime") or ""
     meeting_title = clean_text(row.get("title"))
@@ -125,25 +232,38 @@ def match_printed_hearing(row: Mapping[str, str], hearings_index: Mapping[str, L
 
     window = timedelta(days=7)
     best_match: Tuple[float, HearingRecord, str] | None = None
-    for system_code in system_codes:
-        records = hearings_index.get(system_code) or []
-        for record in records:
-            if not record.pdf_url:
-                continue
-            confidence = jaro_winkler_similarity(meeting_title.lower(), record.title.lower())
-            if meeting_date and record.date:
-                if abs((meeting_date - record.date).days) > window.days:
-                    continue
-            method = "fuzzy_date_title"
-            if witnesses and record.witnesses:
-                overlap = _witness_overlap(witnesses, record.witnesses)
-                if overlap:
-                    confidence = min(1.0, confidence + 0.05 * overlap)
+
+    def consider(record: HearingRecord, base_method: str) -> None:
+        nonlocal best_match
+        if not record.pdf_url:
+            return
+        confidence = jaro_winkler_similarity(meeting_title.lower(), record.title.lower())
+        if meeting_date and record.date:
+            if abs((meeting_date - record.date).days) > window.days:
+                return
+        method = base_method
+        if witnesses and record.witnesses:
+            overlap = _witness_overlap(witnesses, record.witnesses)
+            if overlap:
+                confidence = min(1.0, confidence + 0.05 * overlap)
+                if base_method == "fuzzy_date_title":
                     method = "fuzzy_plus_witness"
-            if confidence < 0.9:
+        if confidence < 0.9:
+            return
+        if not best_match or confidence > best_match[0]:
+            best_match = (confidence, record, method)
+
+    for system_code in system_codes:
+        for record in hearings_index.get(system_code) or []:
+            consider(record, "fuzzy_date_title")
+
+    if not best_match and isinstance(hearings_index, HearingsIndex):
+        own_codes = set(system_codes)
+        surnames = [_surname(segment) for segment in witnesses if "," in segment]
+        for record in hearings_index.candidates(surnames, _title_tokens(meeting_title)):
+            if record.system_code in own_codes:
                 continue
-            if not best_match or confidence > best_match[0]:
-                best_match = (confidence, record, method)
+            consider(record, "cross_committee_index")
 
     if best_match:
         confidence, record, method = best_match
@@ -158,5 +278,5 @@ def _witness_overlap(meeting_witnesses: Sequence[str], hearing_witnesses: Sequen
     return len(meeting_tokens & hearing_tokens)
 
 
-__all__ = ["match_printed_hearing", "build_hearings_index"]
+__all__ = ["HearingsIndex", "match_printed_hearing", "build_hearings_index"]
 
@@ -2,9 +2,11 @@
 
 from __future__ import annotations
 
+from collections import deque
 from dataclasses import dataclass, field
 from threading import Lock
 from time import monotonic, sleep
+from typing import Deque
 
 
 @dataclass
@@ -39,5 +41,126 @@ class Throttler:
             self._last_request_ts = monotonic()
 
 
-__all__ = ["Throttler"]
+class CircuitOpenError(RuntimeError):
+    """Raised when the circuit breaker refuses to let a request through."""
+
+
+@dataclass
+class RetryBudget:
+    """A run-wide allowance of retries shared by every API call.
+
+    Per-call retry policies multiply during an outage: thousands of
+    detail fetches each burning their full backoff schedule can stall a
+    run for hours. Once the budget is spent, failing calls raise on
+    their first error instead of retrying.
+    """
+
+    max_retries: int = 500
+    _lock: Lock = field(default_factory=Lock, init=False, repr=False)
+    _used: int = field(default=0, init=False, repr=False)
+
+    def consume(self) -> bool:
+        """Reserve one retry, returning ``False`` when none are left."""
+
+        with self._lock:
+            if self._used >= self.max_retries:
+                return False
+            self._used += 1
+            return True
+
+    def reset(self) -> None:
+        with self._lock:
+            self._used = 0
+
+    @property
+    def remaining(self) -> int:
+        with self._lock:
+            return max(0, self.max_retries - self._used)
+
+
+@dataclass
+class CircuitBreaker:
+    """Pause all callers when the recent error rate spikes.
+
+    Outcomes are tracked over a sliding window of the last
+    ``window_size`` requests. When at least ``min_requests`` have been
+    seen and the failure ratio reaches ``failure_threshold`` the circuit
+    opens and :meth:`before_request` blocks every caller for
+    ``cooldown`` seconds. The first request after the cooldown acts as a
+    probe: success closes the circuit, failure re-opens it. After
+    ``max_trips`` consecutive trips without a success, callers arriving
+    while the circuit is open fail fast with :class:`CircuitOpenError`
+    instead of waiting, so a prolonged outage cannot stall the run
+    indefinitely; a probe is still let through after every cooldown.
+    """
+
+    failure_threshold: float = 0.5
+    window_size: int = 20
+    min_requests: int = 10
+    cooldown: float = 60.0
+    max_trips: int = 5
+    _lock: Lock = field(default_factory=Lock, init=False, repr=False)
+    _outcomes: Deque[bool] = field(default_factory=deque, init=False, repr=False)
+    _open_until: float | None = field(default=None, init=False, repr=False)
+    _half_open: bool = field(default=False, init=False, repr=False)
+    _trips: int = field(default=0, init=False, repr=False)
+
+    def before_request(self) -> None:
+        """Block while the circuit is open, or fail fast after repeated trips."""
+
+        with self._lock:
+            if self._open_until is None:
+                return
+            remaining = self._open_until - monotonic()
+            if remaining > 0:
+                if self._trips >= self.max_trips:
+                    raise CircuitOpenError(f"Circuit breaker open after {self._trips} consecutive trips")
+                # Sleeping under the lock holds back every other caller too.
+                sleep(remaining)
+            self._open_until = None
+            self._half_open = True
+
+    def record_success(self) -> None:
+        with self._lock:
+            self._half_open = False
+            self._trips = 0
+            self._append(True)
+
+    def record_failure(self) -> None:
+        with self._lock:
+            if self._half_open:
+                self._trip()
+                return
+            self._append(False)
+            failures = sum(1 for ok in self._outcomes if not ok)
+            if len(self._outcomes) >= self.min_requests and failures / len(self._outcomes) >= self.failure_threshold:
+                self._trip()
+
+    def reset(self) -> None:
+        """Close the circuit and forget recorded outcomes."""
+
+        with self._lock:
+            self._outcomes.clear()
+            self._open_until = None
+            self._half_open = False
+            self._trips = 0
+
+    @property
+    def is_open(self) -> bool:
+        with self._lock:
+            return self._open_until is not None
+
+    def _append(self, ok: bool) -> None:
+        self._outcomes.append(ok)
+        while len(self._outcomes) > self.window_size:
+            self._outcomes.popleft()
+
+    def _trip(self) -> None:
+        self._trips += 1
+        self._half_open = False
+        self._outcomes.clear()
+        self._open_until = monotonic() + self.cooldown
+
+
+__all__ = ["CircuitBreaker", "CircuitOpenError", "RetryBudget", "Throttler"]
 
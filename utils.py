@@ -3,10 +3,11 @@
 from __future__ import annotations
 
 import csv
+import json
 import logging
 import os
 from pathlib import Path
-from typing import Iterable, List, Mapping, Sequence
+from typing import Dict, Iterable, List, Mapping, Sequence
 
 
 def setup_logger() -> logging.Logger:
@@ -23,16 +24,44 @@ def setup_logger() -> logging.Logger:
 
 
 def write_csv(rows: Iterable[Mapping[str, object]], path: os.PathLike[str] | str, columns: Sequence[str]) -> None:
-    """Write rows to ``path`` ensuring deterministic column order."""
+    """Write rows to ``path`` ensuring deterministic column order.
+
+    Like :func:`write_json`, the file is replaced atomically so readers
+    polling the export never see a truncated CSV.
+    """
 
     path_obj = Path(path)
     path_obj.parent.mkdir(parents=True, exist_ok=True)
-    with path_obj.open("w", encoding="utf-8", newline="") as fh:
+    tmp_path = path_obj.with_name(path_obj.name + ".tmp")
+    with tmp_path.open("w", encoding="utf-8", newline="") as fh:
         writer = csv.DictWriter(fh, fieldnames=list(columns))
         writer.writeheader()
         for row in rows:
             writer.writerow({key: row.get(key, "") for key in columns})
+    os.replace(tmp_path, path_obj)
+
+
+def read_csv(path: os.PathLike[str] | str) -> List[Dict[str, str]]:
+    """Read a CSV written by :func:`write_csv` back into row dictionaries."""
+
+    with Path(path).open("r", encoding="utf-8", newline="") as fh:
+        return list(csv.DictReader(fh))
+
+
+def write_json(data: object, path: os.PathLike[str] | str) -> None:
+    """Atomically write ``data`` as compact JSON to ``path``.
+
+    The payload is written to a sibling temporary file and moved into
+    place so readers never observe a partially written document.
+    """
+
+    path_obj = Path(path)
+    path_obj.parent.mkdir(parents=True, exist_ok=True)
+    tmp_path = path_obj.with_name(path_obj.name + ".tmp")
+    with tmp_path.open("w", encoding="utf-8") as fh:
+        json.dump(data, fh, ensure_ascii=False, separators=(",", ":"))
+    os.replace(tmp_path, path_obj)
 
 
-__all__ = ["setup_logger", "write_csv"]
+__all__ = ["read_csv", "setup_logger", "write_csv", "write_json"]
 